@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from prompt_toolkit import Application
 from prompt_toolkit.buffer import Buffer
 from prompt_toolkit.formatted_text import FormattedText
@@ -6,7 +8,7 @@ from prompt_toolkit.filters import Condition
 from .store import TaskStore
 from .models import Task, Note, Tag
 from .ui import create_style, create_layout
-from .commands import COMMANDS, process_hashtags
+from .commands import COMMANDS, BRACKET_PATTERN, process_hashtags
 from .keybindings import create_keybindings
 
 class InputMode:
@@ -16,6 +18,33 @@ class InputMode:
     EDIT = "EDIT"
     COMPLETE = "COMPLETE"
 
+@lru_cache(maxsize=1024)
+def format_tag(tag_name: str) -> str:
+    """Format a tag name for display; multi-word tags use [[tag name]]."""
+    if ' ' in tag_name:
+        return f"#[[{tag_name}]]"
+    return f"#{tag_name}"
+
+# Static taskpad chrome, built once - every render starts from a copy
+TASKPAD_HEADER = [
+    ('class:title', "CYBERORGANISM TASKPAD\n\n"),
+    ('class:header', "ID    TYPE     CONTENT\n"),
+    ('class:header', "---   ----     -------\n")
+]
+
+# The command menu is static, so its fragments are rendered once at import
+COMMAND_MENU_LINES = (
+    [('class:title', "\nAVAILABLE COMMANDS\n\n")]
+    + [frag for cmd, desc in COMMANDS.items()
+       for frag in (('class:command', f"{cmd:<10}"), ('class:content', f"{desc}\n"))]
+    + [('class:content', "\n")]  # Extra newline at the end
+)
+
+# Built once - the help text never changes
+HELP_MESSAGE = FormattedText([
+    ('class:help', "Press 'Escape' to enter command mode, or type commands directly using '/' such as '/task', '/exit', etc.")
+])
+
 class CyberOrganism:
     def __init__(self, store=None):
         self.store = store if store is not None else TaskStore()
@@ -27,6 +56,9 @@ class CyberOrganism:
         self.selected_index = 0  # Track currently selected item
         self.seen_commands = False  # Track if user has seen command menu
         self.InputMode = InputMode  # Make InputMode accessible to other modules
+        self._prompt_cache = {}  # Prompt fragments per mode, built on first use
+        self._taskpad_cache_key = None  # Inputs the cached taskpad render was built from
+        self._taskpad_cache = None
         
         # Create input buffer with proper configuration
         self.input_buffer = Buffer(
@@ -62,34 +94,48 @@ class CyberOrganism:
         )
         self.kb_listener = None  # Store reference to keyboard listener
 
+    def get_display_entries(self):
+        """Return taskpad entries in display order.
+
+        In edit mode the first slot is None, the placeholder for the new
+        task row; pending tasks follow, then notes.
+        """
+        entries = []
+        if self.mode == InputMode.EDIT:
+            entries.append(None)  # Placeholder for new task slot
+        entries.extend(self.store.get_all_tasks())
+        entries.extend(self.store.get_all_notes())
+        return entries
+
     def get_taskpad_content(self):
         """Generate the main content area text"""
-        lines = [
-            ('class:title', "CYBERORGANISM TASKPAD\n\n"),
-            ('class:header', "ID    TYPE     CONTENT\n"),
-            ('class:header', "---   ----     -------\n")
-        ]
-        
-        def format_tag(tag_name: str) -> str:
-            # If tag contains spaces, use [[tag name]] format
-            if ' ' in tag_name:
-                return f"#[[{tag_name}]]"
-            return f"#{tag_name}"
+        # prompt_toolkit calls this on every redraw, including keystrokes
+        # that don't touch the taskpad - reuse the last render unless
+        # something it depends on has changed
+        cache_key = (
+            self.store.version,
+            self.mode,
+            self.selected_index,
+            self.status_message,
+            self.message_style,
+        )
+        if cache_key == self._taskpad_cache_key:
+            return self._taskpad_cache
+
+        lines = list(TASKPAD_HEADER)
 
-        # Get all entries to display
+        # Get all entries to display (None is the new-task slot in edit mode)
         display_entries = []
-        
-        # In edit mode, add the new task slot as the first entry
-        if self.mode == InputMode.EDIT:
-            display_entries.append(("NEW", "[Type here to create new tasks]", []))
-        
-        # Add all tasks
-        for task in self.store.get_all_tasks():
-            display_entries.append(("TASK", task.title, task.tags))
-            
-        # Add all notes
-        for note in self.store.get_all_notes():
-            display_entries.append(("NOTE", note.content[:50] + "..." if len(note.content) > 50 else note.content, note.tags))
+        for entry in self.get_display_entries():
+            if entry is None:
+                display_entries.append(("NEW", "[Type here to create new tasks]", []))
+            elif isinstance(entry, Task):
+                display_entries.append(("TASK", entry.title, entry.tags))
+            else:
+                content = entry.content
+                if len(content) > 50:
+                    content = content[:50] + "..."
+                display_entries.append(("NOTE", content, entry.tags))
         
         # Display all entries with their actual index
         for i, (entry_type, content, tags) in enumerate(display_entries):
@@ -107,60 +153,48 @@ class CyberOrganism:
                 ('class:content', "\n"),  # Empty line before status
                 (f'class:{self.message_style}', f"{self.status_message}\n")
             ])
-            
+
+        self._taskpad_cache_key = cache_key
+        self._taskpad_cache = lines
         return lines
 
     def get_commands_content(self):
         """Generate the commands area text"""
         if not self.command_mode:
             return []
-            
-        lines = [
-            ('class:title', "\nAVAILABLE COMMANDS\n\n")
-        ]
-        
-        for cmd, desc in COMMANDS.items():
-            lines.extend([
-                ('class:command', f"{cmd:<10}"),
-                ('class:content', f"{desc}\n")
-            ])
-            
-        lines.append(('class:content', "\n"))  # Add extra newline at the end
-        return lines
+        return COMMAND_MENU_LINES
 
     def get_prompt(self):
         """Generate the input prompt"""
         mode_str = "COMMAND" if self.command_mode else self.mode
-        prompt_str = "> "
-        return FormattedText([
-            ('class:mode', mode_str),
-            ('class:prompt', f" {prompt_str}")
-        ])
+        prompt = self._prompt_cache.get(mode_str)
+        if prompt is None:
+            prompt = FormattedText([
+                ('class:mode', mode_str),
+                ('class:prompt', " > ")
+            ])
+            self._prompt_cache[mode_str] = prompt
+        return prompt
 
     def get_help_message(self):
         """Generate the help message"""
         # Only show help if user hasn't entered any commands or used command mode
         if self.seen_commands:
             return []
-        return FormattedText([
-            ('class:help', "Press 'Escape' to enter command mode, or type commands directly using '/' such as '/task', '/exit', etc.")
-        ])
+        return HELP_MESSAGE
 
     def log_message(self, message: str, style: str = 'status'):
         """Set a status message with optional style"""
+        if message == self.status_message and style == self.message_style:
+            return  # Nothing visible changed; skip the redraw
         self.status_message = message
         self.message_style = style
         self.app.invalidate()
 
     def _prefill_selected_content(self):
         """Pre-fill input buffer with currently selected item's content"""
-        # Get all entries in display order
-        entries = []
-        if self.mode == InputMode.EDIT:
-            entries.append(None)  # Placeholder for new task slot
-        entries.extend(self.store.get_all_tasks())
-        entries.extend(self.store.get_all_notes())
-        
+        entries = self.get_display_entries()
+
         # Get the selected entry
         if self.selected_index >= len(entries):
             return
@@ -181,10 +215,7 @@ class CyberOrganism:
             
         # Add tags if present
         if entry.tags:
-            tag_str = " " + " ".join(
-                f"#[[{t.name}]]" if ' ' in t.name else f"#{t.name}" 
-                for t in entry.tags
-            )
+            tag_str = " " + " ".join(format_tag(t.name) for t in entry.tags)
             content += tag_str
             
         self.input_buffer.text = content
@@ -212,19 +243,13 @@ class CyberOrganism:
             # Always start with the "new task" slot selected
             self.selected_index = 0
             self._prefill_selected_content()
-            self.app.invalidate()
             self.log_message(f"Switched to EDIT mode")
         elif cmd == "complete" or command.startswith("complete "):
             if command.startswith("complete "):
                 # Handle direct task completion
                 try:
                     task_num = int(command.split(" ", 1)[1].strip())
-                    # Get entries in display order
-                    display_entries = []
-                    if self.mode == InputMode.EDIT:
-                        display_entries.append(None)  # Placeholder for new task slot
-                    display_entries.extend(self.store.get_all_tasks())
-                    display_entries.extend(self.store.get_all_notes())
+                    display_entries = self.get_display_entries()
 
                     if task_num >= len(display_entries) or task_num < 0:
                         self.log_message("Invalid task number", 'warning')
@@ -232,8 +257,7 @@ class CyberOrganism:
                         self.log_message("Cannot complete a note or new task slot", 'warning')
                     else:
                         task = display_entries[task_num]
-                        task.complete()
-                        self.store._save()
+                        self.store.complete_task(task.id)
                         self.log_message(f"Marked task {task_num} as completed")
                 except ValueError:
                     self.log_message("Invalid task number", 'warning')
@@ -259,13 +283,9 @@ class CyberOrganism:
                     item_num = int(item_num_str)
                 except ValueError:
                     raise ValueError("Invalid item number")
-                
-                entries = []
-                if self.mode == InputMode.EDIT:
-                    entries.append(None)  # Placeholder for new task slot
-                entries.extend(self.store.get_all_tasks())
-                entries.extend(self.store.get_all_notes())
-                
+
+                entries = self.get_display_entries()
+
                 if item_num >= len(entries) or item_num < 0:
                     raise ValueError("Invalid item number")
                 
@@ -274,11 +294,9 @@ class CyberOrganism:
                     raise ValueError("Cannot add tags to new task slot")
                 
                 # Process tags - handle both multi-word [[tags]] and single word tags
-                import re
                 tags = []
-                
+
                 # First extract any [[multi word tags]]
-                bracket_pattern = r'\[\[(.*?)\]\]'  # Updated pattern
                 # Replace multi-word tags with placeholders and collect them
                 placeholder_counter = 0
                 placeholders = {}
@@ -292,8 +310,8 @@ class CyberOrganism:
                         placeholder_counter += 1
                         return placeholder
                     return ""
-                    
-                processed_str = re.sub(bracket_pattern, replace_tag, tags_str)
+
+                processed_str = BRACKET_PATTERN.sub(replace_tag, tags_str)
                 
                 # Now split remaining text on spaces and process each tag
                 for tag in processed_str.split():
@@ -305,10 +323,12 @@ class CyberOrganism:
                 if not tags:
                     raise ValueError("No valid tags provided")
                 
-                # Add tags to the selected entry
+                # Add tags to the selected entry, then persist the whole
+                # batch with one save rather than writing per tag
                 for tag in tags:
                     entry.add_tag(Tag(name=tag))
-                
+                self.store._save()
+
                 tag_list = ", ".join(f"'{t}'" for t in tags)
                 entry_type = "task" if isinstance(entry, Task) else "note"
                 self.log_message(f"Added tags {tag_list} to {entry_type} {item_num}")
@@ -1,6 +1,12 @@
+import re
 from typing import Dict, List, Tuple
 from .models import Task, Note, Tag
 
+# Compiled once at import - these run on every keystroke-submitted input,
+# so the pattern work shouldn't be repeated per call
+HASHTAG_BRACKET_PATTERN = re.compile(r'#\[\[(.*?)\]\]')
+BRACKET_PATTERN = re.compile(r'\[\[(.*?)\]\]')
+
 COMMANDS = {
     "task": "Enter task mode - new input will be saved as tasks",
     "note": "Enter note mode - new input will be saved as notes",
@@ -21,11 +27,8 @@ def process_hashtags(text: str) -> tuple[str, set[Tag]]:
     """
     tags = set()
     content_words = []
-    
-    # Handle multi-word tags first
-    import re
-    # Find all instances of #[[...]]
-    bracket_pattern = r'#\[\[(.*?)\]\]'
+
+    # Handle multi-word tags first: find all instances of #[[...]]
     # Replace multi-word tags with placeholders and collect the tags
     placeholder_counter = 0
     placeholders = {}
@@ -48,8 +51,8 @@ def process_hashtags(text: str) -> tuple[str, set[Tag]]:
             placeholder_counter += 1
             return placeholder
         return ""
-        
-    processed_text = re.sub(bracket_pattern, replace_tag, text)
+
+    processed_text = HASHTAG_BRACKET_PATTERN.sub(replace_tag, text)
     
     # Now process the remaining text for simple hashtags
     words = processed_text.split()
@@ -108,7 +111,6 @@ def handle_command(app_state, command: str) -> None:
         # Always start with the "new task" slot selected
         app_state.selected_index = 0
         app_state._prefill_selected_content()
-        app_state.app.invalidate()
         app_state.log_message(f"Switched to EDIT mode")
     elif cmd == "command":  # Hidden command to enter command mode
         app_state.command_mode = True
@@ -131,10 +133,8 @@ def handle_command(app_state, command: str) -> None:
                     app_state.log_message("Invalid task number", 'warning')
                 else:
                     task = tasks[task_num]
-                    task.complete()
-                    app_state.store._save()
+                    app_state.store.complete_task(task.id)
                     app_state.log_message(f"Marked task {task_num} as completed")
-                    app_state.app.invalidate()
             except ValueError:
                 app_state.log_message("Invalid task number", 'warning')
         else:
@@ -168,11 +168,9 @@ def handle_command(app_state, command: str) -> None:
                 raise ValueError("Cannot add tags to new task slot")
             
             # Process tags - handle both multi-word [[tags]] and single word tags
-            import re
             tags = []
-            
+
             # First extract any [[multi word tags]]
-            bracket_pattern = r'\[\[(.*?)\]\]'  # Updated pattern
             # Replace multi-word tags with placeholders and collect them
             placeholder_counter = 0
             placeholders = {}
@@ -186,8 +184,8 @@ def handle_command(app_state, command: str) -> None:
                     placeholder_counter += 1
                     return placeholder
                 return ""
-                
-            processed_str = re.sub(bracket_pattern, replace_tag, tags_str)
+
+            processed_str = BRACKET_PATTERN.sub(replace_tag, tags_str)
             
             # Now split remaining text on spaces and process each tag
             for tag in processed_str.split():
@@ -199,10 +197,12 @@ def handle_command(app_state, command: str) -> None:
             if not tags:
                 raise ValueError("No valid tags provided")
             
-            # Add tags to the selected entry
+            # Add tags to the selected entry, then persist the whole batch
+            # with one save rather than writing per tag
             for tag in tags:
                 entry.add_tag(Tag(name=tag))
-            
+            app_state.store._save()
+
             tag_list = ", ".join(f"'{t}'" for t in tags)
             entry_type = "task" if isinstance(entry, Task) else "note"
             app_state.log_message(f"Added tags {tag_list} to {entry_type} {item_num}")
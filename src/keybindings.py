@@ -68,7 +68,7 @@ def create_keybindings(app) -> KeyBindings:
     @kb.add('up', filter=Condition(lambda: app.mode == app.InputMode.EDIT and not app.command_mode))
     def handle_up(event):
         """Move selection up in edit mode."""
-        total_items = len(app.store.get_all_tasks()) + len(app.store.get_all_notes()) + 1
+        total_items = app.store.pending_task_count + len(app.store.notes) + 1
         if total_items > 0:
             app.selected_index = (app.selected_index - 1) % total_items
             app._prefill_selected_content()
@@ -77,26 +77,14 @@ def create_keybindings(app) -> KeyBindings:
     @kb.add('down', filter=Condition(lambda: app.mode == app.InputMode.EDIT and not app.command_mode))
     def handle_down(event):
         """Move selection down in edit mode."""
-        total_items = len(app.store.get_all_tasks()) + len(app.store.get_all_notes()) + 1
+        total_items = app.store.pending_task_count + len(app.store.notes) + 1
         if total_items > 0:
             app.selected_index = (app.selected_index + 1) % total_items
             app._prefill_selected_content()
             app.app.invalidate()
 
-    def complete_selected_task():
-        """Complete the currently selected task in edit mode."""
-        # Get all entries in display order
-        entries = []
-        if app.mode == app.InputMode.EDIT:
-            entries.append(None)  # Placeholder for new task slot
-        entries.extend(app.store.get_all_tasks())
-        entries.extend(app.store.get_all_notes())
-
-        # Get the selected entry
-        if app.selected_index >= len(entries):
-            return
-
-        entry = entries[app.selected_index]
+    def complete_selected_task(entry):
+        """Complete the given selected entry in edit mode."""
         if entry is None:
             app.log_message("Cannot complete new task slot", 'warning')
         elif not isinstance(entry, Task):
@@ -112,11 +100,11 @@ def create_keybindings(app) -> KeyBindings:
         """Process input when enter is pressed."""
         logger.debug("Enter pressed")
         text = app.input_buffer.text
-        logger.debug(f"Buffer text: {text!r}")
-        logger.debug(f"Current mode: {app.mode}")
-        logger.debug(f"Command mode: {app.command_mode}")
-        logger.debug(f"Selected index: {app.selected_index}")
-        logger.debug(f"Ctrl state: {ctrl_pressed}")
+        logger.debug("Buffer text: %r", text)
+        logger.debug("Current mode: %s", app.mode)
+        logger.debug("Command mode: %s", app.command_mode)
+        logger.debug("Selected index: %s", app.selected_index)
+        logger.debug("Ctrl state: %s", ctrl_pressed)
 
         # Mark help as seen since user is entering a command
         app.seen_commands = True
@@ -132,7 +120,7 @@ def create_keybindings(app) -> KeyBindings:
             if app.mode == app.InputMode.TASK:
                 logger.debug("Processing task creation")
                 cleaned_text, tags = process_hashtags(text)
-                logger.debug(f"Cleaned text: {cleaned_text!r}, tags: {tags}")
+                logger.debug("Cleaned text: %r, tags: %s", cleaned_text, tags)
                 task = Task(title=cleaned_text)
                 for tag in tags:  # tags are now Tag objects, so add them directly
                     task.add_tag(tag)
@@ -163,31 +151,27 @@ def create_keybindings(app) -> KeyBindings:
                     app.log_message("Please enter a valid task number", 'warning')
             elif app.mode == app.InputMode.EDIT:
                 logger.debug("Processing edit mode")
-                # Get all entries in display order
-                entries = []
-                entries.append(None)  # Placeholder for new task slot
-                entries.extend(app.store.get_all_tasks())
-                entries.extend(app.store.get_all_notes())
+                entries = app.get_display_entries()
 
                 # Get the selected entry
                 if app.selected_index >= len(entries):
-                    logger.debug(f"Invalid selected_index {app.selected_index} >= {len(entries)}")
+                    logger.debug("Invalid selected_index %s >= %s", app.selected_index, len(entries))
                     return
 
                 entry = entries[app.selected_index]
-                logger.debug(f"Selected entry: {entry}")
+                logger.debug("Selected entry: %s", entry)
 
                 # Check for ctrl+enter first
                 if ctrl_pressed:
                     logger.debug("Ctrl+Enter detected")
                     if isinstance(entry, Task):
                         logger.debug("Completing task")
-                        complete_selected_task()
+                        complete_selected_task(entry)
                     return
 
                 # Handle normal edit mode
                 cleaned_text, tags = process_hashtags(text)
-                logger.debug(f"Cleaned text: {cleaned_text!r}, tags: {tags}")
+                logger.debug("Cleaned text: %r, tags: %s", cleaned_text, tags)
                 if entry is None:
                     logger.debug("Creating new task in edit mode")
                     task = Task(title=cleaned_text)
@@ -200,20 +184,22 @@ def create_keybindings(app) -> KeyBindings:
                     if isinstance(entry, Task):
                         logger.debug("Updating existing task")
                         entry.title = cleaned_text
-                        entry.tags.clear()
+                        entry.clear_tags()
                         for tag in tags:
                             entry.add_tag(tag)
+                        app.store._save()
                         app.log_message(f"Updated task {app.selected_index}")
                     else:  # Note
                         logger.debug("Updating existing note")
                         entry.content = cleaned_text
-                        entry.tags.clear()
+                        entry.clear_tags()
                         for tag in tags:
                             entry.add_tag(tag)
+                        app.store._save()
                         app.log_message(f"Updated note {app.selected_index}")
 
         # Only clear buffer if we're not in edit mode or if we just created a new task
-        logger.debug(f"Checking if buffer should be cleared - mode: {app.mode}, selected_index: {app.selected_index}")
+        logger.debug("Checking if buffer should be cleared - mode: %s, selected_index: %s", app.mode, app.selected_index)
         if app.mode == app.InputMode.TASK or app.mode == app.InputMode.NOTE or app.mode == app.InputMode.COMPLETE or (app.mode == app.InputMode.EDIT and app.selected_index == 0):
             logger.debug("Clearing buffer")
             app.input_buffer.reset()
@@ -3,16 +3,29 @@ import os
 from pathlib import Path
 
 def setup_logger():
-    """Setup debug logger that writes to logs/debug.log"""
+    """Setup debug logger that writes to logs/debug.log
+
+    Debug logging is opt-in via the CYBERORGANISM_DEBUG environment
+    variable. The input handlers log on every keystroke, so when the
+    variable is unset we skip the file handler and raise the level so the
+    hot path pays as little as possible for disabled messages.
+    """
+    logger = logging.getLogger("cyberorganism")
+
+    if not os.environ.get("CYBERORGANISM_DEBUG"):
+        logger.setLevel(logging.WARNING)
+        logger.addHandler(logging.NullHandler())
+        return logger
+
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
-    
+
     # Clear existing log file
     log_file = log_dir / "debug.log"
     if log_file.exists():
         log_file.unlink()
-    
+
     # Configure logging
     logging.basicConfig(
         level=logging.DEBUG,
@@ -21,5 +34,5 @@ def setup_logger():
             logging.FileHandler(log_file),
         ]
     )
-    
-    return logging.getLogger("cyberorganism")
+
+    return logger
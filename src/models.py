@@ -3,13 +3,13 @@ from datetime import datetime
 from typing import Optional, Set, Dict, Any
 from uuid import UUID, uuid4
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Tag:
     name: str
     value: Optional[Any] = None
     schema: Optional[str] = None
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     id: UUID = field(default_factory=uuid4)
     title: str = ""
@@ -20,6 +20,11 @@ class Task:
     completed: bool = field(default=False)
     completed_at: Optional[datetime] = field(default=None)
     recurring_days: Optional[int] = field(default=None)  # Number of days between recurrences
+    # Derived from tags so has_tag is a set lookup instead of a scan
+    _tag_names: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._tag_names = {tag.name for tag in self.tags}
 
     def add_tag(self, tag: Tag) -> None:
         # Check for special recurring tag format
@@ -29,32 +34,49 @@ class Task:
             except (ValueError, TypeError):
                 pass  # Invalid recurring value, ignore
         self.tags.add(tag)
+        self._tag_names.add(tag.name)
 
     def remove_tag(self, tag_name: str) -> None:
         self.tags = {tag for tag in self.tags if tag.name != tag_name}
+        self._tag_names.discard(tag_name)
         if tag_name == "recurring":
             self.recurring_days = None
 
+    def clear_tags(self) -> None:
+        self.tags.clear()
+        self._tag_names.clear()
+
     def has_tag(self, tag_name: str) -> bool:
-        return any(tag.name == tag_name for tag in self.tags)
+        return tag_name in self._tag_names
 
     def complete(self) -> None:
         self.completed = True
         self.completed_at = datetime.now()
 
-@dataclass
+@dataclass(slots=True)
 class Note:
     id: UUID = field(default_factory=uuid4)
     content: str = ""
     created_at: datetime = field(default_factory=lambda: datetime.now())
     tags: Set[Tag] = field(default_factory=set)
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # Derived from tags so has_tag is a set lookup instead of a scan
+    _tag_names: Set[str] = field(default_factory=set, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._tag_names = {tag.name for tag in self.tags}
 
     def add_tag(self, tag: Tag) -> None:
         self.tags.add(tag)
+        self._tag_names.add(tag.name)
 
     def remove_tag(self, tag_name: str) -> None:
         self.tags = {tag for tag in self.tags if tag.name != tag_name}
+        self._tag_names.discard(tag_name)
+
+    def clear_tags(self) -> None:
+        self.tags.clear()
+        self._tag_names.clear()
 
     def has_tag(self, tag_name: str) -> bool:
-        return any(tag.name == tag_name for tag in self.tags)
+        return tag_name in self._tag_names
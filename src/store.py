@@ -11,9 +11,12 @@ class TaskStore:
         self.filepath = filepath
         self.tasks: Dict[UUID, Task] = {}
         self.notes: Dict[UUID, Note] = {}
+        self._pending_count = 0  # Maintained incrementally; counts uncompleted tasks
+        self.version = 0  # Bumped on every save so views can cache render output
         self._load()
 
     def _save(self) -> None:
+        self.version += 1
         data = {
             "tasks": {str(id): self._serialize_item(task) for id, task in self.tasks.items()},
             "notes": {str(id): self._serialize_item(note) for id, note in self.notes.items()}
@@ -34,11 +37,14 @@ class TaskStore:
                 
             for note_id, note_data in data.get("notes", {}).items():
                 self.notes[UUID(note_id)] = self._deserialize_note(note_data)
+
+            self._pending_count = sum(1 for task in self.tasks.values() if not task.completed)
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             print(f"Error loading data: {e}")
             # Start fresh if file is corrupted
             self.tasks = {}
             self.notes = {}
+            self._pending_count = 0
 
     def _serialize_item(self, item: Union[Task, Note]) -> dict:
         tags = [{
@@ -96,8 +102,15 @@ class TaskStore:
             metadata=data.get("metadata", {})
         )
 
+    @property
+    def pending_task_count(self) -> int:
+        """Number of uncompleted tasks, tracked without scanning the task dict."""
+        return self._pending_count
+
     def add_task(self, task: Task) -> None:
         self.tasks[task.id] = task
+        if not task.completed:
+            self._pending_count += 1
         self._save()
 
     def handle_completed_task(self, task: Task) -> None:
@@ -107,18 +120,23 @@ class TaskStore:
             next_task = Task(
                 title=task.title,
                 description=task.description,
-                tags=task.tags,  # This will include the recurring tag
+                tags=set(task.tags),  # Fresh set (includes the recurring tag) - don't alias the old task's
                 metadata=task.metadata.copy(),
                 recurring_days=task.recurring_days
             )
             # Set created_at to when the current task was completed plus recurring_days
             next_task.created_at = task.completed_at + timedelta(days=task.recurring_days)
-            self.add_task(next_task)
+            # Insert directly; the caller is responsible for saving so the
+            # completion and the new recurring task land in a single write
+            self.tasks[next_task.id] = next_task
+            self._pending_count += 1
 
     def complete_task(self, task_id: UUID) -> None:
         """Complete a task and handle recurring logic."""
-        if task_id in self.tasks:
-            task = self.tasks[task_id]
+        task = self.tasks.get(task_id)
+        if task is not None:
+            if not task.completed:
+                self._pending_count -= 1
             task.complete()
             self.handle_completed_task(task)
             self._save()
@@ -134,13 +152,14 @@ class TaskStore:
         return self.notes.get(note_id)
 
     def remove_task(self, task_id: UUID) -> None:
-        if task_id in self.tasks:
-            del self.tasks[task_id]
+        task = self.tasks.pop(task_id, None)
+        if task is not None:
+            if not task.completed:
+                self._pending_count -= 1
             self._save()
 
     def remove_note(self, note_id: UUID) -> None:
-        if note_id in self.notes:
-            del self.notes[note_id]
+        if self.notes.pop(note_id, None) is not None:
             self._save()
 
     def get_tasks_by_tag(self, tag_name: str, include_completed: bool = False) -> List[Task]:
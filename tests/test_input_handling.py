@@ -40,31 +40,47 @@ def mock_input():
         with create_app_session(input=pipe_input, output=DummyOutput()):
             yield pipe_input
 
+def wait_until(condition, timeout=1.0, interval=0.005):
+    """Poll until condition() is true, instead of sleeping a fixed interval."""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(interval)
+    return condition()
+
 @pytest.fixture
 def app(clean_store):
     """Create a CyberOrganism instance."""
     # Create app instance with the store file path
     app = CyberOrganism(store=TaskStore(clean_store))
-    
+
     # Start app in a separate thread
     thread = threading.Thread(target=app.run)
     thread.daemon = True  # Thread will be killed when test exits
     thread.start()
-    
-    # Wait a bit for app to start
-    time.sleep(0.1)
-    
+
+    # Wait for the app to start
+    wait_until(lambda: app.app.is_running)
+
     yield app
-    
+
     # Stop the app
     app.running = False
     thread.join(timeout=1)
 
-def send_text(mock_input, app, text):
-    """Helper to send text to the app."""
+def send_text(mock_input, app, text, until=None):
+    """Helper to send text to the app.
+
+    When `until` is given, block until that condition holds rather than
+    sleeping a fixed interval; otherwise fall back to a short sleep.
+    """
     app.input_buffer.text = text
     mock_input.send_text('\n')  # Simulate Enter key
-    time.sleep(0.1)  # Give app time to process input
+    if until is not None:
+        assert wait_until(until), "timed out waiting for input to be processed"
+    else:
+        time.sleep(0.05)  # Give app time to process input
 
 def test_basic_task_input(mock_input, app):
     """Test basic task input handling."""
@@ -73,7 +89,8 @@ def test_basic_task_input(mock_input, app):
     app.command_mode = False
     
     # Send input
-    send_text(mock_input, app, "Test task #important")
+    send_text(mock_input, app, "Test task #important",
+              until=lambda: app.store.get_all_tasks())
     
     # Verify task was created
     tasks = app.store.get_all_tasks()
@@ -89,7 +106,8 @@ def test_note_input(mock_input, app):
     app.command_mode = False
     
     # Send input
-    send_text(mock_input, app, "Test note #[[category: test]]")
+    send_text(mock_input, app, "Test note #[[category: test]]",
+              until=lambda: app.store.get_all_notes())
     
     # Verify note was created
     notes = app.store.get_all_notes()
@@ -105,7 +123,7 @@ def test_command_mode(mock_input, app):
     app.command_mode = True
     
     # Send command
-    send_text(mock_input, app, "note")
+    send_text(mock_input, app, "note", until=lambda: app.mode == InputMode.NOTE)
     
     # Verify mode was switched
     assert app.mode == InputMode.NOTE
@@ -118,7 +136,7 @@ def test_slash_command(mock_input, app):
     app.command_mode = False
     
     # Send slash command
-    send_text(mock_input, app, "/note")
+    send_text(mock_input, app, "/note", until=lambda: app.mode == InputMode.NOTE)
     
     # Verify mode was switched
     assert app.mode == InputMode.NOTE
@@ -132,7 +150,8 @@ def test_edit_mode_new_task(mock_input, app):
     app.selected_index = 0  # New task slot
     
     # Send input
-    send_text(mock_input, app, "New task in edit mode #priority")
+    send_text(mock_input, app, "New task in edit mode #priority",
+              until=lambda: app.store.get_all_tasks())
     
     # Verify task was created
     tasks = app.store.get_all_tasks()
@@ -145,7 +164,7 @@ def test_edit_mode_update_task(mock_input, app):
     """Test updating an existing task in edit mode."""
     # Create a task first
     app.mode = InputMode.TASK
-    send_text(mock_input, app, "Original title")
+    send_text(mock_input, app, "Original title", until=lambda: app.store.get_all_tasks())
     
     # Switch to edit mode and select the task
     app.mode = InputMode.EDIT
@@ -153,7 +172,8 @@ def test_edit_mode_update_task(mock_input, app):
     app.selected_index = 1  # Skip new task slot
     
     # Send update
-    send_text(mock_input, app, "Updated title #updated")
+    send_text(mock_input, app, "Updated title #updated",
+              until=lambda: any(t.title == "Updated title" for t in app.store.get_all_tasks()))
     
     # Verify task was updated
     tasks = app.store.get_all_tasks()
@@ -166,14 +186,15 @@ def test_complete_task_command(mock_input, app):
     """Test completing a task via command."""
     # Create a task first
     app.mode = InputMode.TASK
-    send_text(mock_input, app, "Task to complete")
+    send_text(mock_input, app, "Task to complete", until=lambda: app.store.get_all_tasks())
     
     # Switch to command mode
     app.mode = InputMode.TASK
     app.command_mode = True
     
     # Send complete command
-    send_text(mock_input, app, "complete 0")  # Complete first task
+    send_text(mock_input, app, "complete 0",  # Complete first task
+              until=lambda: any(t.completed for t in app.store.get_all_tasks(include_completed=True)))
     
     # Verify task was completed
     tasks = app.store.get_all_tasks(include_completed=True)